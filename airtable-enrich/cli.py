@@ -3,27 +3,117 @@
 """
 Entry point for running all data enrichment commands.
 """
+import collections
+import concurrent.futures
 import functools
+import hashlib
 import os
 import pathlib
-from typing import Optional
+import pickle
+import queue
+import threading
+import time
+from typing import (
+    Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+)
 
 import airtable
 import click
 import dotenv
 import geopandas as gpd
+import numpy as np
+import orjson
 import requests
+import tqdm
 import shapely.geometry
+import shapely.prepared
 
 
 DATA_DIR = pathlib.Path(__file__).parent / "data"
 TRACT_SHP = DATA_DIR / "cb_2019_06_tract_500k.zip"
 
+CACHE_DIR = pathlib.Path("~/.cache/airtable-enrich").expanduser()
+
+# Airtable accepts at most 10 records per write request and 5
+# requests per second per base
+AIRTABLE_BATCH_SIZE = 10
+AIRTABLE_RATE_LIMIT = 5.0
+AIRTABLE_CONCURRENCY = 5
+
+# Rows to accumulate from the download stream before running a
+# batched tract lookup over them
+PAGE_SIZE = 1000
+
 
 CENSUS_GEOCODER_URL = "https://geocoding.geo.census.gov/geocoder/geographies/coordinates"
 DEFAULT_BENCHMARK = "Public_AR_Current"
 DEFAULT_VINTAGE = "Current_Current"
 
+# How many geocoder requests to keep in flight, and the cap on how
+# many we start per second across all workers
+GEOCODER_CONCURRENCY = 8
+GEOCODER_RATE_LIMIT = 10.0
+
+# How many points to submit to the worker pool at a time. The
+# geocoder's batch endpoint only accepts street addresses, not
+# coordinates, so lookups cannot be combined into one request; large
+# chunks amortize the submission overhead instead and bound how much
+# work is in flight between cache writes.
+GEOCODER_CHUNK_SIZE = 1000
+
+
+class _RateLimiter:
+    """Token bucket that caps calls per second across worker threads."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self._interval
+
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _make_session() -> requests.Session:
+    """Build a session that reuses connections to the census geocoder.
+
+    Keeping the TCP+TLS connection open across calls removes a
+    handshake round trip per lookup, and the retry policy absorbs the
+    geocoder's occasional rate-limit and server errors.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(
+            pool_maxsize=32,
+            max_retries=requests.adapters.Retry(
+                total=5,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        ),
+    )
+    return session
+
+
+_THREAD_LOCAL = threading.local()
+
+
+def _thread_session() -> requests.Session:
+    # Sessions are not thread safe, so give each worker thread its own
+    session = getattr(_THREAD_LOCAL, "session", None)
+    if session is None:
+        session = _make_session()
+        _THREAD_LOCAL.session = session
+    return session
+
 
 def tract_from_census_geocoder(lat: float, lng: float) -> Optional[str]:
     params = {
@@ -34,8 +124,10 @@ def tract_from_census_geocoder(lat: float, lng: float) -> Optional[str]:
         "benchmark": DEFAULT_BENCHMARK,
     }
 
-    with requests.get(CENSUS_GEOCODER_URL, params=params, timeout=20) as r:
-        response = r.json()
+    with _thread_session().get(
+        CENSUS_GEOCODER_URL, params=params, timeout=20
+    ) as r:
+        response = orjson.loads(r.content)
 
         result = response.get("result")
         if not result:
@@ -54,23 +146,439 @@ def tract_from_census_geocoder(lat: float, lng: float) -> Optional[str]:
         return tract["GEOID"]
 
 
-# Cache of loaded tracts geodataframe
+_GEOCODER_RATE_LIMITER = _RateLimiter(GEOCODER_RATE_LIMIT)
+
+# Sentinel distinguishing "not cached" from a cached no-tract result
+_MISSING = object()
+
+
+class _GeocoderCache:
+    """Persistent map from rounded lat-lng to geocoder results.
+
+    Re-runs against the same table mostly repeat coordinates, so
+    keeping results on disk turns those into local lookups instead of
+    network round trips. Coordinates are rounded to 1e-6 degrees
+    (~10cm) to collapse floating point jitter between runs.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        self._entries = {}
+        if path.exists():
+            try:
+                with open(path, "rb") as f:
+                    self._entries = pickle.load(f)
+            except Exception:
+                # An unreadable cache only costs re-geocoding; start
+                # empty rather than crashing every future run
+                self._entries = {}
+
+    def _key(self, lat: float, lng: float) -> tuple:
+        return (
+            round(lat, 6), round(lng, 6), DEFAULT_BENCHMARK, DEFAULT_VINTAGE
+        )
+
+    def lookup(self, lat: float, lng: float):
+        with self._lock:
+            return self._entries.get(self._key(lat, lng), _MISSING)
+
+    def store(self, lat: float, lng: float, geoid: Optional[str]) -> None:
+        with self._lock:
+            self._entries[self._key(lat, lng)] = geoid
+            self._dirty = True
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a sibling file and rename so an interrupted
+            # flush never truncates the existing cache
+            tmp_path = self._path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(self._entries, f)
+            os.replace(tmp_path, self._path)
+            self._dirty = False
+
+
+# Cache of the on-disk geocoder result cache, a module global for the
+# same reason as _TRACTS since every worker thread consults it
+_GEOCODER_CACHE: Optional[_GeocoderCache] = None
+
+
+def _geocoder_cache() -> _GeocoderCache:
+    global _GEOCODER_CACHE
+    if _GEOCODER_CACHE is None:
+        _GEOCODER_CACHE = _GeocoderCache(CACHE_DIR / "geocoder.pkl")
+    return _GEOCODER_CACHE
+
+
+def _geocode_one(latlng: Tuple[float, float]) -> Optional[str]:
+    cache = _geocoder_cache()
+
+    geoid = cache.lookup(*latlng)
+    if geoid is not _MISSING:
+        return geoid
+
+    _GEOCODER_RATE_LIMITER.wait()
+    geoid = tract_from_census_geocoder(*latlng)
+
+    cache.store(*latlng, geoid)
+    return geoid
+
+
+def tracts_from_latlngs_geocoder(
+    latlngs: Sequence[Tuple[float, float]]
+) -> Iterator[Optional[str]]:
+    """Query the census geocoder for many points concurrently.
+
+    Each lookup spends most of its time waiting on the network, so a
+    small thread pool keeps several requests in flight, throttled to
+    stay under the geocoder's tolerance for concurrent clients.
+    Results are yielded in input order as they complete. Points are
+    submitted in large chunks, and the result cache is written back
+    after each chunk so an interrupted run keeps its progress.
+    """
+    # Touch the result cache before fanning out so the workers never
+    # race to construct it
+    cache = _geocoder_cache()
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=GEOCODER_CONCURRENCY
+    ) as executor:
+        for start in range(0, len(latlngs), GEOCODER_CHUNK_SIZE):
+            chunk = latlngs[start:start + GEOCODER_CHUNK_SIZE]
+            yield from executor.map(_geocode_one, chunk)
+            cache.flush()
+
+
+# Number of grid cells per axis in the tract cell index
+GRID_BITS = 10
+GRID_SIZE = 1 << GRID_BITS
+
+
+# Cache of the shapefile content hash used to key on-disk artifacts.
+# The geopandas version is folded in because the pickles contain
+# pandas internals, which do not round-trip across library upgrades.
 @functools.cache
+def _tracts_cache_key() -> str:
+    content = hashlib.md5(TRACT_SHP.read_bytes()).hexdigest()
+    return f"{gpd.__version__}-{content}"
+
+
+def _load_cached(name: str, build: Callable):
+    """Load a pickled artifact keyed by the shapefile contents.
+
+    Parsing the zipped shapefile and building the cell index dominate
+    cold-start latency, so persist them across invocations and rebuild
+    only when the shapefile changes. A cache file that no longer
+    unpickles (truncated, or written by incompatible library versions)
+    is rebuilt rather than crashing the run.
+    """
+    path = CACHE_DIR / f"{name}-{_tracts_cache_key()}.pkl"
+    if path.exists():
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass
+
+    value = build()
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        pickle.dump(value, f)
+
+    return value
+
+
+# Cache of loaded tracts geodataframe. A plain module global avoids
+# the per-call lock functools.cache takes, which would serialize the
+# worker threads; the GIL makes the None check safe and a rare
+# duplicate load is idempotent.
+_TRACTS: Optional[gpd.GeoDataFrame] = None
+
+
 def load_tracts() -> gpd.GeoDataFrame:
-    return gpd.read_file(TRACT_SHP)
+    global _TRACTS
+    if _TRACTS is None:
+        # pyogrio reads the whole layer in one vectorized call instead
+        # of iterating features through Python like the fiona engine
+        _TRACTS = _load_cached(
+            "tracts", lambda: gpd.read_file(TRACT_SHP, engine="pyogrio")
+        )
+    return _TRACTS
 
 
-def tract_from_census_shapefile(lat: float, lng: float) -> Optional[str]:
+# Shift-and-mask rounds spreading an integer's bits into the even
+# positions of a 64-bit Morton key
+_SPREAD_ROUNDS = (
+    (np.uint64(16), np.uint64(0x0000FFFF0000FFFF)),
+    (np.uint64(8), np.uint64(0x00FF00FF00FF00FF)),
+    (np.uint64(4), np.uint64(0x0F0F0F0F0F0F0F0F)),
+    (np.uint64(2), np.uint64(0x3333333333333333)),
+    (np.uint64(1), np.uint64(0x5555555555555555)),
+)
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    values = values.astype(np.uint64)
+    for shift, mask in _SPREAD_ROUNDS:
+        values = (values | (values << shift)) & mask
+    return values
+
+
+def _morton_keys(ix: np.ndarray, iy: np.ndarray) -> np.ndarray:
+    """Interleave the bits of two grid coordinates into Morton keys."""
+    return _spread_bits(ix) | (_spread_bits(iy) << np.uint64(1))
+
+
+def _build_cell_index() -> dict:
+    """Map every grid cell that lies entirely inside a tract to that tract.
+
+    Linearizing the grid onto a Morton curve turns the common-case
+    lookup into a single binary search over a sorted integer array
+    instead of a tree descent with bbox tests. Cells that straddle a
+    tract border are left out and fall back to the bounding box broad
+    phase with exact contains tests.
+    """
+    tracts_gpd = load_tracts()
+
+    minx, miny, maxx, maxy = tracts_gpd.total_bounds
+    cell_w = (maxx - minx) / GRID_SIZE
+    cell_h = (maxy - miny) / GRID_SIZE
+
+    ixs = []
+    iys = []
+    tract_idxs = []
+    for tract_idx, geom in enumerate(tracts_gpd.geometry):
+        prepared = shapely.prepared.prep(geom)
+
+        gminx, gminy, gmaxx, gmaxy = geom.bounds
+        ix0 = max(int((gminx - minx) / cell_w), 0)
+        ix1 = min(int((gmaxx - minx) / cell_w), GRID_SIZE - 1)
+        iy0 = max(int((gminy - miny) / cell_h), 0)
+        iy1 = min(int((gmaxy - miny) / cell_h), GRID_SIZE - 1)
+
+        for ix in range(ix0, ix1 + 1):
+            for iy in range(iy0, iy1 + 1):
+                cell = shapely.geometry.box(
+                    minx + ix * cell_w,
+                    miny + iy * cell_h,
+                    minx + (ix + 1) * cell_w,
+                    miny + (iy + 1) * cell_h,
+                )
+                if prepared.contains_properly(cell):
+                    ixs.append(ix)
+                    iys.append(iy)
+                    tract_idxs.append(tract_idx)
+
+    cell_keys = _morton_keys(
+        np.array(ixs, dtype=np.uint64), np.array(iys, dtype=np.uint64)
+    )
+    order = np.argsort(cell_keys)
+
+    return {
+        "origin": (minx, miny),
+        "cell_size": (cell_w, cell_h),
+        "cell_keys": cell_keys[order],
+        "cell_tracts": np.array(tract_idxs, dtype=np.int32)[order],
+    }
+
+
+# Cache of the grid cell index over the tracts
+@functools.cache
+def load_cell_index() -> dict:
+    return _load_cached("cell-index", _build_cell_index)
+
+
+# Cache of flat per-tract bounding box arrays for the broad phase
+@functools.cache
+def load_bboxes() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    bounds = load_tracts().geometry.bounds
+    return (
+        np.ascontiguousarray(bounds["minx"].values),
+        np.ascontiguousarray(bounds["miny"].values),
+        np.ascontiguousarray(bounds["maxx"].values),
+        np.ascontiguousarray(bounds["maxy"].values),
+    )
+
+
+# Cache of prepared tract geometries for repeated contains tests
+@functools.cache
+def load_prepared() -> list:
+    return [shapely.prepared.prep(geom) for geom in load_tracts().geometry]
+
+
+def tracts_from_latlngs(
+    lats: Sequence[float], lngs: Sequence[float]
+) -> List[Optional[str]]:
+    """Look up the census tract for each lat-lng in one batched query.
+
+    Points landing on a grid cell that lies entirely inside a tract are
+    resolved with a binary search over the cell index; only points on
+    cells straddling a tract border fall back to the bounding box
+    broad phase with prepared contains tests.
+    """
     tracts_gpd = load_tracts()
+    cell_index = load_cell_index()
 
-    lng_lat = shapely.geometry.Point(lng, lat)
+    lats_arr = np.asarray(lats, dtype=np.float64)
+    lngs_arr = np.asarray(lngs, dtype=np.float64)
 
-    matches = tracts_gpd.sindex.query(lng_lat, 'within')
+    minx, miny = cell_index["origin"]
+    cell_w, cell_h = cell_index["cell_size"]
 
-    if matches.size == 0:
-        return None
+    ix = np.floor((lngs_arr - minx) / cell_w).astype(np.int64)
+    iy = np.floor((lats_arr - miny) / cell_h).astype(np.int64)
+    in_grid = (
+        (ix >= 0) & (ix < GRID_SIZE) & (iy >= 0) & (iy < GRID_SIZE)
+    )
 
-    return tracts_gpd["GEOID"].iloc[matches[0]]
+    keys = _morton_keys(
+        np.clip(ix, 0, GRID_SIZE - 1).astype(np.uint64),
+        np.clip(iy, 0, GRID_SIZE - 1).astype(np.uint64),
+    )
+
+    cell_keys = cell_index["cell_keys"]
+    pos = np.searchsorted(cell_keys, keys)
+    pos = np.minimum(pos, max(len(cell_keys) - 1, 0))
+
+    if len(cell_keys):
+        hit = in_grid & (cell_keys[pos] == keys)
+    else:
+        hit = np.zeros(len(lats_arr), dtype=bool)
+
+    geoid_values = tracts_gpd["GEOID"].values
+    geoids: List[Optional[str]] = [None] * len(lats_arr)
+
+    for i in np.flatnonzero(hit):
+        geoids[i] = geoid_values[cell_index["cell_tracts"][pos[i]]]
+
+    # Border cells fall back to a vectorized bounding box broad phase:
+    # four array compares narrow the candidates to typically zero or
+    # one tract, and only those get a GEOS contains test
+    miss = np.flatnonzero(~hit)
+    if miss.size:
+        minxs, minys, maxxs, maxys = load_bboxes()
+        prepared = load_prepared()
+        for i in miss:
+            lng = lngs_arr[i]
+            lat = lats_arr[i]
+            candidates = np.flatnonzero(
+                (minxs <= lng) & (lng <= maxxs)
+                & (minys <= lat) & (lat <= maxys)
+            )
+            if not candidates.size:
+                continue
+
+            point = shapely.geometry.Point(lng, lat)
+            for idx in candidates:
+                # Prepared geometries amortize the edge preprocessing
+                # for contains tests across calls
+                if prepared[idx].contains(point):
+                    geoids[i] = geoid_values[idx]
+                    break
+
+    return geoids
+
+
+def tract_from_census_shapefile(lat: float, lng: float) -> Optional[str]:
+    return tracts_from_latlngs([lat], [lng])[0]
+
+
+# Sentinel marking the end of the streamed rows
+_END_OF_STREAM = object()
+
+
+def _stream_rows(
+    table: airtable.Airtable, limit: Optional[int], fields: List[str]
+) -> Iterator[dict]:
+    """Yield rows from Airtable as they arrive.
+
+    The download runs on a background thread feeding a bounded queue,
+    so tract lookups overlap network ingress instead of waiting for
+    the full record set, and peak memory tracks the queue size rather
+    than the table size.
+    """
+    rows_queue: queue.Queue = queue.Queue(maxsize=PAGE_SIZE)
+    errors: List[Exception] = []
+
+    def produce() -> None:
+        try:
+            for row in table.get_all(maxRecords=limit, fields=fields):
+                rows_queue.put(row)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            rows_queue.put(_END_OF_STREAM)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    while True:
+        row = rows_queue.get()
+        if row is _END_OF_STREAM:
+            break
+        yield row
+
+    producer.join()
+    if errors:
+        raise errors[0]
+
+
+def _iter_chunks(items: Iterable, size: int) -> Iterator[List]:
+    chunk: List = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _apply_updates(
+    table: airtable.Airtable,
+    tract_field: str,
+    updates: Iterable[Tuple[str, str]],
+) -> Iterator[List[Tuple[str, str]]]:
+    """Apply (row id, geoid) updates in chunks from a small thread pool.
+
+    A pool of workers keeps several write requests in flight while a
+    shared token bucket holds the base under the API rate limit. The
+    updates may be a lazy iterable: each chunk is submitted as soon as
+    it fills, with at most AIRTABLE_CONCURRENCY chunks in flight, so
+    writes overlap whatever stage is producing them without draining
+    the whole iterable into memory first. Updates travel as plain
+    (id, geoid) pairs and only become the API's record dicts here,
+    one chunk at a time.
+    Yields each chunk as it is applied so progress can be reported.
+    """
+    limiter = _RateLimiter(AIRTABLE_RATE_LIMIT)
+
+    def apply_one(chunk: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        limiter.wait()
+        table.batch_update([
+            {"id": row_id, "fields": {tract_field: geoid}}
+            for row_id, geoid in chunk
+        ])
+        return chunk
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=AIRTABLE_CONCURRENCY
+    ) as executor:
+        pending: collections.deque = collections.deque()
+        for chunk in _iter_chunks(updates, AIRTABLE_BATCH_SIZE):
+            pending.append(executor.submit(apply_one, chunk))
+            if len(pending) >= AIRTABLE_CONCURRENCY:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
 
 
 @click.group()
@@ -134,39 +642,62 @@ def fill_census(
     """Print the head of the table"""
     table = airtable.Airtable(basekey, tablename, apikey)
 
-    # Download all the rows locally because
-    # we are going to modify them in bulk.
-    with click.progressbar(
-        table.get_all(maxRecords=limit), label="Retrieving rows"
-    ) as rows:
-        table_data = list(rows)
-
-    # Query for census data for each row
-    updates = []
-    with click.progressbar(
-        table_data, label="Querying for census data"
-    ) as rows:
-        for row in rows:
-            lat_str = row["fields"].get(lat_field)
-            lng_str = row["fields"].get(lng_field)
+    if engine not in ("geocoder", "shapefile"):
+        raise Exception(f"Invalid engine specified {engine}")
 
-            if not lat_str or not lng_str:
-                click.echo(
-                    f"Skip row {row['id']} because it "
-                    "is missing a lat-lng value"
-                )
-                continue
+    def enrich_page(page: List[dict]) -> Iterator[Tuple[str, str]]:
+        # Grab each row's fields dict once instead of re-subscripting
+        # the row for every field read
+        row_fields = [row["fields"] for row in page]
 
-            lat = float(lat_str)
-            lng = float(lng_str)
+        # Parse the lat-lng columns in one vectorized pass; rows with
+        # a missing value parse to nan and are skipped.
+        lats = np.array(
+            [fields.get(lat_field) or "nan" for fields in row_fields],
+            dtype=np.float64,
+        )
+        lngs = np.array(
+            [fields.get(lng_field) or "nan" for fields in row_fields],
+            dtype=np.float64,
+        )
 
-            if engine == "geocoder":
-                tract = tract_from_census_geocoder(lat, lng)
-            elif engine == "shapefile":
-                tract = tract_from_census_shapefile(lat, lng)
-            else:
-                raise Exception(f"Invalid engine specified {engine}")
+        valid = ~(np.isnan(lats) | np.isnan(lngs))
+        for i in np.flatnonzero(~valid):
+            click.echo(
+                f"Skip row {page[i]['id']} because it "
+                "is missing a lat-lng value"
+            )
+
+        points = [
+            (page[i], row_fields[i], float(lats[i]), float(lngs[i]))
+            for i in np.flatnonzero(valid)
+        ]
+        if not points:
+            return
+
+        # Rows often share an address, so collapse duplicate
+        # coordinates (rounded to ~1m) and look each unique point
+        # up once
+        coords = np.stack(
+            [np.round(lats[valid], 5), np.round(lngs[valid], 5)], axis=1
+        )
+        unique_coords, inverse = np.unique(
+            coords, axis=0, return_inverse=True
+        )
 
+        # Query for census data for each unique point
+        if engine == "geocoder":
+            latlngs = [
+                (float(lat), float(lng)) for lat, lng in unique_coords
+            ]
+            unique_tracts = list(tracts_from_latlngs_geocoder(latlngs))
+        else:
+            unique_tracts = tracts_from_latlngs(
+                unique_coords[:, 0], unique_coords[:, 1]
+            )
+
+        for (row, fields, lat, lng), tract_idx in zip(points, inverse):
+            tract = unique_tracts[tract_idx]
             if not tract:
                 click.echo(
                     f"Skip row {row['id']} because "
@@ -176,9 +707,9 @@ def fill_census(
 
             # Strip the leading zero off the geoid because that
             # is the format used by HPI :(
-            geoid = str(int(tract))
+            geoid = tract.lstrip("0") or "0"
 
-            existing_geoid = row["fields"].get(tract_field)
+            existing_geoid = fields.get(tract_field)
             if existing_geoid == geoid:
                 # Skip updating value because it is the same
                 continue
@@ -191,33 +722,88 @@ def fill_census(
                 )
                 continue
 
-            updates.append({
-                "id": row["id"],
-                "fields": {tract_field: geoid},
-            })
-
-    # Verify if we should issue an update
-    if not updates:
-        click.echo('No rows needed to be updated.')
-        return
+            yield row["id"], geoid
+
+    def generate_updates() -> Iterator[Tuple[str, str]]:
+        # Stream rows from Airtable and enrich them a page at a time
+        # so tract lookups overlap the download. Only request the
+        # fields we read so wide tables don't pay to download every
+        # column.
+        page: List[dict] = []
+        rows = tqdm.tqdm(
+            _stream_rows(table, limit, [lat_field, lng_field, tract_field]),
+            desc="Enriching rows",
+            unit="row",
+            miniters=100,
+            mininterval=0.5,
+        )
+        for row in rows:
+            page.append(row)
+            if len(page) >= PAGE_SIZE:
+                yield from enrich_page(page)
+                page = []
 
-    example_value = updates[0]['fields'][tract_field]
+        if page:
+            yield from enrich_page(page)
 
     if confirm:
+        # Confirming needs the full update count up front, so collect
+        # the updates before applying any of them
+        updates = list(generate_updates())
+
+        if not updates:
+            click.echo('No rows needed to be updated.')
+            return
+
+        example_value = updates[0][1]
         click.confirm(
             f"Apply {len(updates)} updates "
             f"e.g. {tract_field}={example_value}?",
             abort=True
         )
+
+        # Apply the updates in parallel chunks
+        num_chunks = (
+            (len(updates) + AIRTABLE_BATCH_SIZE - 1) // AIRTABLE_BATCH_SIZE
+        )
+        chunks = tqdm.tqdm(
+            _apply_updates(table, tract_field, updates),
+            total=num_chunks,
+            desc="Applying updates",
+            unit="chunk",
+            mininterval=0.5,
+        )
+        for _ in chunks:
+            pass
     else:
+        # Without a confirmation gate the stages fuse into one
+        # pipeline: rows stream in, pages are enriched, and update
+        # chunks are written while later pages are still arriving
+        applied = 0
+        example_value = None
+        with tqdm.tqdm(
+            desc="Applying updates",
+            unit="update",
+            miniters=100,
+            mininterval=0.5,
+        ) as progress:
+            for chunk in _apply_updates(
+                table, tract_field, generate_updates()
+            ):
+                if example_value is None:
+                    example_value = chunk[0][1]
+                applied += len(chunk)
+                progress.update(len(chunk))
+
+        if not applied:
+            click.echo('No rows needed to be updated.')
+            return
+
         click.echo(
-            f"Appling {len(updates)} updates "
-            f"e.g. {tract_field}={example_value}?"
+            f"Applied {applied} updates "
+            f"e.g. {tract_field}={example_value}"
         )
 
-    # Apply the update in bulk
-    table.batch_update(updates)
-
 
 @cli.command()
 def version():